@@ -1,14 +1,20 @@
 from itsdangerous import BadData, SignatureExpired, URLSafeTimedSerializer
 from typing import Optional
+from functools import lru_cache
 import hmac
 from pyview.secret import get_secret
 
 
+@lru_cache(maxsize=32)
+def _serializer(secret: str, salt: str) -> URLSafeTimedSerializer:
+    return URLSafeTimedSerializer(secret, salt=salt)
+
+
 def generate_csrf_token(value: str, salt: Optional[str] = None) -> str:
     """
     Generate a CSRF token.
     """
-    s = URLSafeTimedSerializer(get_secret(), salt=salt or "pyview-csrf-token")
+    s = _serializer(get_secret(), salt or "pyview-csrf-token")
     return s.dumps(value)  # type: ignore
 
 
@@ -16,7 +22,7 @@ def validate_csrf_token(data: str, expected: str, salt: Optional[str] = None) ->
     """
     Validate a CSRF token.
     """
-    s = URLSafeTimedSerializer(get_secret(), salt=salt or "pyview-csrf-token")
+    s = _serializer(get_secret(), salt or "pyview-csrf-token")
     try:
         token = s.loads(data, max_age=3600)
         return hmac.compare_digest(token, expected)
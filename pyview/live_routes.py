@@ -10,11 +10,13 @@ class LiveViewLookup:
         self.routes[path] = lv
 
     def get(self, path: str) -> LiveView:
+        # paths are matched exactly (plus an optional trailing slash), so lookup is
+        # a dict hit regardless of how many views are registered
         lv = self.routes.get(path)
-        if not lv and path.endswith("/"):
-            lv = self.routes[path[:-1]]
+        if lv is None and path.endswith("/"):
+            lv = self.routes.get(path[:-1])
 
-        if not lv:
+        if lv is None:
             raise ValueError("No LiveView found for path: " + path)
 
         return lv()
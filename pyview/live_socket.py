@@ -12,12 +12,16 @@ from typing import (
     TypeGuard,
 )
 from urllib.parse import urlencode
+import asyncio
+import datetime
+import logging
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
-from pyview.vendor.flet.pubsub import PubSubHub, PubSub
+from apscheduler.jobstores.base import JobLookupError
+from pyview.vendor.flet.pubsub import PubSubHub
 from pyview.events import InfoEvent
 from pyview.uploads import UploadConstraints, UploadConfig, UploadManager
 from pyview.meta import PyViewMeta
-import datetime
+from pyview.phx_message import serialize_message
 
 
 if TYPE_CHECKING:
@@ -59,19 +63,39 @@ class ConnectedLiveViewSocket(Generic[T]):
         self.liveview = liveview
         self.scheduled_jobs = []
         self.connected = True
-        self.pub_sub = PubSub(pub_sub_hub, topic)
         self.pending_events = []
         self.upload_manager = UploadManager()
+        self._pending_sends: dict[str, Any] = {}
+        self._send_event = asyncio.Event()
+        self._send_worker: Optional[asyncio.Task] = None
+        self._info_tasks: set[asyncio.Task] = set()
+
+        # server pushes all share the [null, null, topic, ...] envelope, so the
+        # topic is only encoded once
+        self._topic_json = json.dumps(topic)
+
+        # live_patch frames only vary by "to", so everything before it is encoded once
+        self._live_patch_prefix = (
+            self._envelope_prefix("live_patch") + '{"kind":"push","to":'
+        )
+
+    def _envelope_prefix(self, event: str) -> str:
+        return f'[null,null,{self._topic_json},"{event}",'
+
+    def _envelope(self, event: str, body: str) -> str:
+        return self._envelope_prefix(event) + body + "]"
 
     @property
     def meta(self) -> PyViewMeta:
         return PyViewMeta()
 
     async def subscribe(self, topic: str):
-        await self.pub_sub.subscribe_topic_async(topic, self._topic_callback_internal)
+        await pub_sub_hub.subscribe_topic_async(
+            self.topic, topic, self._topic_callback_internal
+        )
 
     async def broadcast(self, topic: str, message: Any):
-        await self.pub_sub.send_all_on_topic_async(topic, message)
+        await pub_sub_hub.send_all_on_topic_async(topic, message)
 
     async def _topic_callback_internal(self, topic, message):
         await self.send_info(InfoEvent(topic, message))
@@ -79,18 +103,67 @@ class ConnectedLiveViewSocket(Generic[T]):
     def schedule_info(self, event, seconds):
         id = f"{self.topic}:{event}"
         scheduler.add_job(
-            self.send_info, args=[event], id=id, trigger="interval", seconds=seconds
+            self._queue_info,
+            args=[id, event],
+            id=id,
+            trigger="interval",
+            seconds=seconds,
         )
         self.scheduled_jobs.append(id)
 
+    async def _queue_info(self, key: str, event: Any):
+        # Interval fires are coalesced per job: if a render for this job is still
+        # pending, the newer fire replaces it rather than queueing another render.
+        if not self.connected:
+            return
+
+        self._pending_sends[key] = event
+        self._send_event.set()
+        if self._send_worker is None:
+            self._send_worker = asyncio.create_task(self._drain_pending_sends())
+
+    async def _drain_pending_sends(self):
+        while self.connected:
+            await self._send_event.wait()
+            self._send_event.clear()
+            while self._pending_sends and self.connected:
+                key = next(iter(self._pending_sends))
+                try:
+                    await self.send_info(self._pending_sends.pop(key))
+                except Exception as e:
+                    logging.error("Error sending scheduled info", exc_info=e)
+
     def schedule_info_once(self, event, seconds=None):
-        scheduler.add_job(
-            self.send_info,
-            args=[event],
-            trigger="date",
-            run_date=datetime.datetime.now() + datetime.timedelta(seconds=seconds or 0),
-            misfire_grace_time=None,
-        )
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # not on the event loop (e.g. called from a thread); the scheduler
+            # can still deliver it
+            scheduler.add_job(
+                self.send_info,
+                args=[event],
+                trigger="date",
+                run_date=datetime.datetime.now()
+                + datetime.timedelta(seconds=seconds or 0),
+                misfire_grace_time=None,
+            )
+            return
+
+        def fire():
+            # the loop only holds a weak reference to tasks, so keep our own
+            task = loop.create_task(self.send_info(event))
+            self._info_tasks.add(task)
+            task.add_done_callback(self._info_task_done)
+
+        if seconds:
+            loop.call_later(seconds, fire)
+        else:
+            loop.call_soon(fire)
+
+    def _info_task_done(self, task: asyncio.Task):
+        self._info_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logging.error("Error sending info", exc_info=task.exception())
 
     def diff(self, render: dict[str, Any]) -> dict[str, Any]:
         # TODO: not a real diff
@@ -100,33 +173,31 @@ class ConnectedLiveViewSocket(Generic[T]):
     async def send_info(self, event: InfoEvent):
         await self.liveview.handle_info(event, self)
         r = await self.liveview.render(self.context, self.meta)
-        resp = [None, None, self.topic, "diff", self.diff(r.tree())]
+        resp = self._envelope("diff", serialize_message(self.diff(r.tree())))
 
         try:
-            await self.websocket.send_text(json.dumps(resp))
+            await self.websocket.send_text(resp)
         except Exception:
-            for id in self.scheduled_jobs:
-                print("Removing job", id)
+            if self.scheduled_jobs:
+                print("Removing jobs", self.scheduled_jobs)
+                await asyncio.to_thread(self._remove_scheduled_jobs)
+
+    def _remove_scheduled_jobs(self):
+        # Runs in a worker thread; APScheduler's remove_job takes the job store lock.
+        jobs, self.scheduled_jobs = self.scheduled_jobs, []
+        for id in jobs:
+            try:
                 scheduler.remove_job(id)
+            except JobLookupError:
+                pass
 
     async def push_patch(self, path: str, params: dict[str, Any] = {}):
-        # or "replace"
-        kind = "push"
-
         to = path
         if params:
             to = to + "?" + urlencode(params)
 
-        message = [
-            None,
-            None,
-            self.topic,
-            "live_patch",  # or "live_redirect"
-            {
-                "kind": kind,
-                "to": to,
-            },
-        ]
+        # kind is always "push" for now; "replace" and "live_redirect" aren't sent yet
+        message = self._live_patch_prefix + json.dumps(to) + "}]"
 
         # TODO another way to marshall this
         for k in params:
@@ -134,7 +205,7 @@ class ConnectedLiveViewSocket(Generic[T]):
 
         await self.liveview.handle_params(to, params, self)
         try:
-            await self.websocket.send_text(json.dumps(message))
+            await self.websocket.send_text(message)
         except Exception as e:
             print("Error sending message", e)
 
@@ -148,9 +219,13 @@ class ConnectedLiveViewSocket(Generic[T]):
 
     async def close(self):
         self.connected = False
-        for id in self.scheduled_jobs:
-            scheduler.remove_job(id)
-        await self.pub_sub.unsubscribe_all_async()
+        if self.scheduled_jobs:
+            await asyncio.to_thread(self._remove_scheduled_jobs)
+        if self._send_worker is not None:
+            self._send_worker.cancel()
+            self._send_worker = None
+        self._pending_sends.clear()
+        await pub_sub_hub.unsubscribe_all_async(self.topic)
 
         try:
             self.upload_manager.close()
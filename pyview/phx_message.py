@@ -1,6 +1,16 @@
 from starlette.websockets import WebSocketDisconnect
 from starlette.types import Message
 import json
+from typing import Any
+
+
+def serialize_message(message: Any) -> str:
+    """
+    Encodes an outgoing Phoenix message.  Frames are sent as compact JSON text:
+    the Phoenix client hands binary frames to its binary decoder, so JSON can't be
+    sent via send_bytes.
+    """
+    return json.dumps(message, separators=(",", ":"))
 
 
 def parse_message(message: Message) -> tuple[str, str, str, str, dict]:
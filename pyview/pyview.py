@@ -4,8 +4,9 @@ from starlette.responses import HTMLResponse
 from starlette.middleware.gzip import GZipMiddleware
 from starlette.routing import Route
 from starlette.requests import Request
-import uuid
-from urllib.parse import parse_qs, urlparse
+from starlette.datastructures import URL
+import secrets
+from urllib.parse import parse_qs, urlparse, ParseResult
 
 from pyview.live_socket import UnconnectedSocket
 from pyview.csrf import generate_csrf_token
@@ -36,7 +37,9 @@ class PyView(Starlette):
             await self.live_handler.handle(websocket)
 
         self.add_websocket_route("/live/websocket", live_websocket_endpoint)
-        self.add_middleware(GZipMiddleware)
+        # small first renders aren't worth compressing, and level 6 is much cheaper
+        # than the default 9 for nearly the same size
+        self.add_middleware(GZipMiddleware, minimum_size=1500, compresslevel=6)
 
     def add_live_view(self, path: str, view: type[LiveView]):
         async def lv(request: Request):
@@ -49,6 +52,16 @@ class PyView(Starlette):
         self.routes.append(Route(path, auth.wrap(lv), methods=["GET"]))
 
 
+def _parse_result(url: URL) -> ParseResult:
+    # starlette has already split the url; only urlparse's ;params need a re-parse
+    parts = url.components
+    if ";" in parts.path:
+        return urlparse(str(url))
+    return ParseResult(
+        parts.scheme, parts.netloc, parts.path, "", parts.query, parts.fragment
+    )
+
+
 async def liveview_container(
     template: RootTemplate, view_lookup: LiveViewLookup, request: Request
 ):
@@ -60,18 +73,20 @@ async def liveview_container(
     session = request.session if "session" in request.scope else {}
 
     await lv.mount(s, session)
-    await lv.handle_params(urlparse(url._url), parse_qs(url.query), s)
+    # most views don't override handle_params; skip parsing the url for them
+    if lv.__class__.handle_params is not LiveView.handle_params:
+        await lv.handle_params(_parse_result(url), parse_qs(url.query), s)
     r = await lv.render(s.context, PyViewMeta())
 
     liveview_css = find_associated_css(lv)
 
-    id = str(uuid.uuid4())
+    id = secrets.token_hex(16)
 
     context: RootTemplateContext = {
         "id": id,
         "content": r.text(),
         "title": s.live_title,
-        "csrf_token": generate_csrf_token("lv:phx-" + id),
+        "csrf_token": generate_csrf_token(f"lv:phx-{id}"),
         "session": serialize_session(session),
         "additional_head_elements": liveview_css,
     }
@@ -1,13 +1,19 @@
 from typing import Any, cast
+from functools import lru_cache
 from itsdangerous import URLSafeSerializer
 from pyview.secret import get_secret
 
 
+@lru_cache(maxsize=1)
+def _serializer(secret: str) -> URLSafeSerializer:
+    return URLSafeSerializer(secret, salt="pyview-session")
+
+
 def serialize_session(session: dict[str, Any]) -> str:
-    s = URLSafeSerializer(get_secret(), salt="pyview-session")
+    s = _serializer(get_secret())
     return cast(str, s.dumps(session))
 
 
 def deserialize_session(ser: str) -> dict[str, Any]:
-    s = URLSafeSerializer(get_secret(), salt="pyview-session")
+    s = _serializer(get_secret())
     return cast(dict[str, Any], s.loads(ser))
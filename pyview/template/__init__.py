@@ -1,5 +1,11 @@
 from pyview.vendor.ibis import Template
-from .live_template import LiveTemplate, template_file, RenderedContent, LiveRender
+from .live_template import (
+    LiveTemplate,
+    template_file,
+    warm_templates,
+    RenderedContent,
+    LiveRender,
+)
 from .root_template import RootTemplate, RootTemplateContext, defaultRootTemplate
 from .utils import find_associated_css, find_associated_file
 from .context_processor import context_processor
@@ -8,6 +14,7 @@ __all__ = [
     "Template",
     "LiveTemplate",
     "template_file",
+    "warm_templates",
     "RenderedContent",
     "LiveRender",
     "RootTemplate",
@@ -9,6 +9,7 @@ def context_processor(func):
 
 
 def apply_context_processors(meta: PyViewMeta):
+    # always a fresh dict; callers merge their assigns into it
     context = {}
 
     for processor in context_processors:
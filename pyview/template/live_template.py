@@ -1,8 +1,9 @@
 from pyview.vendor.ibis import Template
 from typing import Any, Union, Protocol, Optional, ClassVar
-from dataclasses import asdict, Field
+from dataclasses import Field
 from .serializer import serialize
 import os.path
+import stat
 from pyview.template.context_processor import apply_context_processors
 from pyview.meta import PyViewMeta
 
@@ -28,14 +29,16 @@ class LiveTemplate:
     def tree(self, assigns: Assigns, meta: PyViewMeta) -> dict[str, Any]:
         if not isinstance(assigns, dict):
             assigns = serialize(assigns)
-        additional_context = apply_context_processors(meta)
-        return self.t.tree(additional_context | assigns)
+        context = apply_context_processors(meta)
+        context.update(assigns)
+        return self.t.tree(context)
 
     def render(self, assigns: Assigns, meta: PyViewMeta) -> str:
         if not isinstance(assigns, dict):
-            assigns = asdict(assigns)
-        additional_context = apply_context_processors(meta)
-        return self.t.render(additional_context | assigns)
+            assigns = serialize(assigns)
+        context = apply_context_processors(meta)
+        context.update(assigns)
+        return self.t.render(context)
 
     def text(self, assigns: Assigns, meta: PyViewMeta) -> str:
         return self.render(assigns, meta)
@@ -68,10 +71,15 @@ _cache = {}
 
 def template_file(filename: str) -> Optional[LiveTemplate]:
     """Renders a template file with the given assigns."""
-    if not os.path.isfile(filename):
+    # a single stat both checks the file exists and gives us its mtime
+    try:
+        st = os.stat(filename)
+    except OSError:
+        return None
+    if not stat.S_ISREG(st.st_mode):
         return None
 
-    mtime = os.path.getmtime(filename)
+    mtime = st.st_mtime_ns
     if filename in _cache:
         cached_mtime, cached_template = _cache[filename]
         if cached_mtime == mtime:
@@ -81,3 +89,26 @@ def template_file(filename: str) -> Optional[LiveTemplate]:
         t = LiveTemplate(Template(f.read(), template_id=filename))
         _cache[filename] = (mtime, t)
         return t
+
+
+def warm_templates(root: str) -> int:
+    """
+    Parses every .html template under root so first renders don't pay for it.
+
+    Call this after the view modules are imported: templates may use filters a
+    view registers at import time, and parsing them before that raises a
+    TemplateSyntaxError.
+    """
+    # views look their templates up by absolute path, so cache them under one
+    return _warm_templates(os.path.abspath(root))
+
+
+def _warm_templates(root: str) -> int:
+    count = 0
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                count += _warm_templates(entry.path)
+            elif entry.name.endswith(".html") and template_file(entry.path):
+                count += 1
+    return count
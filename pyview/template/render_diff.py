@@ -2,38 +2,58 @@ from typing import Any
 
 
 def calc_diff(old_tree: dict[str, Any], new_tree: dict[str, Any]) -> dict[str, Any]:
-    diff = {}
-    for key in new_tree:
-        if key not in old_tree:
-            diff[key] = new_tree[key]
-        elif (
-            isinstance(new_tree[key], dict)
-            and "s" in new_tree[key]
-            and "d" in new_tree[key]
-        ):
-            if isinstance(old_tree[key], str):
-                diff[key] = new_tree[key]
+    diff: dict[str, Any] = {}
+    if old_tree is new_tree:
+        return diff
+
+    # Walk the trees with an explicit stack rather than recursing per nested dict.
+    # Nested diffs are attached to their parent as they're discovered; the ones
+    # that turn out empty are pruned afterwards, children before parents.
+    stack = [(diff, old_tree, new_tree)]
+    nested = []
+
+    while stack:
+        node_diff, old, new = stack.pop()
+
+        for key, new_value in new.items():
+            if key not in old:
+                node_diff[key] = new_value
                 continue
 
-            # Handle special case of for loop
-            old_static = old_tree[key].get("s", [])
-            new_static = new_tree[key]["s"]
+            old_value = old[key]
+            # the same object can't have changed; statics lists are shared between
+            # renders of a template, so this also skips comparing them element-wise
+            if old_value is new_value:
+                continue
+
+            if type(new_value) is not dict:
+                if old_value != new_value:
+                    node_diff[key] = new_value
+                continue
+
+            if type(old_value) is not dict:
+                node_diff[key] = new_value
+                continue
 
-            old_dynamic = old_tree[key]["d"]
-            new_dynamic = new_tree[key]["d"]
+            if "s" in new_value and "d" in new_value:
+                # Handle special case of for loop
+                new_static = new_value["s"]
+                new_dynamic = new_value["d"]
 
-            if old_static != new_static:
-                diff[key] = {"s": new_static, "d": new_dynamic}
+                old_static = old_value.get("s", [])
+                if old_static is not new_static and old_static != new_static:
+                    node_diff[key] = {"s": new_static, "d": new_dynamic}
+                elif old_value["d"] != new_dynamic:
+                    node_diff[key] = {"d": new_dynamic}
                 continue
 
-            if old_dynamic != new_dynamic:
-                diff[key] = {"d": new_dynamic}
+            child: dict[str, Any] = {}
+            node_diff[key] = child
+            nested.append((node_diff, key, child))
+            stack.append((child, old_value, new_value))
 
-        elif isinstance(new_tree[key], dict):
-            nested_diff = calc_diff(old_tree[key], new_tree[key])
-            if nested_diff:
-                diff[key] = nested_diff
-        elif old_tree[key] != new_tree[key]:
-            diff[key] = new_tree[key]
+    for parent, key, child in reversed(nested):
+        if not child:
+            del parent[key]
 
     return diff
@@ -1,4 +1,6 @@
-from typing import Callable, Optional, TypedDict
+from typing import Callable, Optional, TypedDict, Union
+import re
+from functools import partial
 from markupsafe import Markup
 
 
@@ -11,65 +13,103 @@ class RootTemplateContext(TypedDict):
     additional_head_elements: list[Markup]
 
 
-RootTemplate = Callable[[RootTemplateContext], str]
+# Root templates may return the page as bytes to skip the response's own encode.
+RootTemplate = Callable[[RootTemplateContext], Union[str, bytes]]
 ContentWrapper = Callable[[RootTemplateContext, Markup], Markup]
 
 
 def defaultRootTemplate(
     css: Optional[Markup] = None, content_wrapper: Optional[ContentWrapper] = None
 ) -> RootTemplate:
-    content_wrapper = content_wrapper or (lambda c, m: m)
+    return partial(
+        _defaultRootTemplate,
+        css=css or Markup(""),
+        contentWrapper=content_wrapper or (lambda c, m: m),
+    )
 
-    def template(context: RootTemplateContext) -> str:
-        return _defaultRootTemplate(context, css or Markup(""), content_wrapper)
 
-    return template
+_TITLE_SUFFIX = " | LiveView"
 
 
-def _defaultRootTemplate(
-    context: RootTemplateContext, css: Markup, contentWrapper: ContentWrapper
-) -> str:
-    suffix = " | LiveView"
-    render_title = (context["title"] + suffix) if context.get("title", None) is not None else "LiveView"  # type: ignore
-    main_content = contentWrapper(
-        context,
-        Markup(
-            f"""
+def _split_placeholders(template: str) -> tuple[str, ...]:
+    return tuple(re.split(r"\{\w+\}", template))
+
+
+# The constant parts of the page are split once, at import, around each
+# substitution; rendering just joins them with the per-request values.
+_MAIN_PARTS = _split_placeholders(
+    """
       <div
         data-phx-main="true"
-        data-phx-session="{context['session']}"
+        data-phx-session="{session}"
         data-phx-static=""
-        id="phx-{context['id']}"
+        id="phx-{id}"
         >
-        {context['content']}
+        {content}
     </div>"""
-        ),
-    )
+)
 
-    additional_head_elements = "\n".join(context["additional_head_elements"])
-
-    return (
-        Markup(
-            f"""
+_PAGE_PARTS = _split_placeholders(
+    f"""
 <!DOCTYPE html>
 <html lang="en">
     <head>
-      <title data-suffix="{suffix}">{render_title}</title>
-      <meta name="csrf-token" content="{context['csrf_token']}" />
+      <title data-suffix="{_TITLE_SUFFIX}">{{render_title}}</title>
+      <meta name="csrf-token" content="{{csrf_token}}" />
       <meta charset="utf-8">
       <meta http-equiv="X-UA-Compatible" content="IE=edge">
       <meta name="viewport" content="width=device-width, initial-scale=1, shrink-to-fit=no">
-      {css}
+      {{css}}
       <script defer type="text/javascript" src="/static/assets/app.js"></script>
-      {additional_head_elements}
+      {{additional_head_elements}}
     </head>
-    <body>"""
-        )
-        + main_content
-        + Markup(
-            """
+    <body>{{main_content}}
     </body>
 </html>
 """
-        )
+)
+
+
+def _defaultRootTemplate(
+    context: RootTemplateContext, css: Markup, contentWrapper: ContentWrapper
+) -> bytes:
+    render_title = (context["title"] + _TITLE_SUFFIX) if context.get("title", None) is not None else "LiveView"  # type: ignore
+    main_content = contentWrapper(
+        context,
+        Markup(
+            "".join(
+                (
+                    _MAIN_PARTS[0],
+                    str(context["session"]),
+                    _MAIN_PARTS[1],
+                    context["id"],
+                    _MAIN_PARTS[2],
+                    context["content"],
+                    _MAIN_PARTS[3],
+                )
+            )
+        ),
     )
+
+    # usually empty or just the view's own css; only join when there's more
+    head_elements = context["additional_head_elements"]
+    if len(head_elements) > 1:
+        additional_head_elements = "\n".join(head_elements)
+    else:
+        additional_head_elements = head_elements[0] if head_elements else ""
+
+    return "".join(
+        (
+            _PAGE_PARTS[0],
+            render_title,
+            _PAGE_PARTS[1],
+            context["csrf_token"],
+            _PAGE_PARTS[2],
+            css,
+            _PAGE_PARTS[3],
+            additional_head_elements,
+            _PAGE_PARTS[4],
+            main_content,
+            _PAGE_PARTS[5],
+        )
+    ).encode("utf-8")
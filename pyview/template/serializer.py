@@ -1,4 +1,5 @@
 from typing import Any, Union, Protocol, Optional
+from functools import lru_cache
 from dataclasses import fields, is_dataclass
 from pydantic import BaseModel
 
@@ -10,10 +11,7 @@ def serialize(assigns: Any) -> dict[str, Any]:
         return assigns
 
     if is_dataclass(assigns):
-        df = [f.name for f in fields(assigns) if not f.name.startswith("_")]
-        pf = prop_names(assigns)
-
-        return {k: getattr(assigns, k) for k in df + pf}
+        return {k: getattr(assigns, k) for k in _serialized_names(type(assigns))}
 
     raise TypeError("Assigns must be a dict or have an asdict() method")
 
@@ -26,6 +24,18 @@ def prop_names(instance: Any) -> list[str]:
     """Returns a list of property names for the given class."""
     # print(fields(cls))
 
-    cls = instance.__class__
+    return list(_class_prop_names(instance.__class__))
+
+
+@lru_cache(maxsize=None)
+def _class_prop_names(cls: type) -> tuple[str, ...]:
+    return tuple(
+        prop for prop in cls.__dict__ if isinstance(cls.__dict__[prop], property)
+    )
+
 
-    return [prop for prop in cls.__dict__ if isinstance(cls.__dict__[prop], property)]
+@lru_cache(maxsize=None)
+def _serialized_names(cls: type) -> tuple[str, ...]:
+    """Public dataclass fields and properties of cls, computed once per class."""
+    df = tuple(f.name for f in fields(cls) if not f.name.startswith("_"))
+    return df + _class_prop_names(cls)
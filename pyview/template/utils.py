@@ -1,24 +1,70 @@
 from typing import Optional
+from functools import lru_cache
 import inspect
 import os
+import time
 from markupsafe import Markup
 
 
+_associated_files: dict[tuple[type, str], str] = {}
+
+# Misses are remembered too, so views without a .css file don't stat it on every
+# request, but they're re-checked after a while so a template or stylesheet added
+# while the app runs is still picked up.
+_MISS_RECHECK_SECONDS = 2.0
+_missing_files: dict[tuple[type, str], float] = {}
+
+
 def find_associated_file(o: object, extension: str) -> Optional[str]:
-    object_file = inspect.getfile(o.__class__)
+    key = (o.__class__, extension)
+    associated_file = _associated_files.get(key)
+    if associated_file is not None:
+        return associated_file
 
-    if object_file.endswith(".py"):
-        object_file = object_file[:-3]
+    now = time.monotonic()
+    checked_at = _missing_files.get(key)
+    if checked_at is not None and now - checked_at < _MISS_RECHECK_SECONDS:
+        return None
 
+    object_file = _class_file_stem(key[0])
+    if object_file is not None:
         associated_file = object_file + extension
         if os.path.isfile(associated_file):
+            _associated_files[key] = associated_file
+            _missing_files.pop(key, None)
             return associated_file
 
+    _missing_files[key] = now
+    return None
+
+
+@lru_cache(maxsize=None)
+def _class_file_stem(cls: type) -> Optional[str]:
+    object_file = inspect.getfile(cls)
+
+    if object_file.endswith(".py"):
+        return object_file[:-3]
+
+
+_css_cache: dict[str, tuple[int, Markup]] = {}
+
 
 def find_associated_css(o: object) -> list[Markup]:
     css_file = find_associated_file(o, ".css")
     if css_file:
+        # re-read when the file changes, like template_file does for templates
+        try:
+            mtime = os.stat(css_file).st_mtime_ns
+        except OSError:
+            return []
+
+        cached = _css_cache.get(css_file)
+        if cached is not None and cached[0] == mtime:
+            return [cached[1]]
+
         with open(css_file, "r") as css:
-            return [Markup(f"<style>{css.read()}</style>")]
+            style = Markup(f"<style>{css.read()}</style>")
+        _css_cache[css_file] = (mtime, style)
+        return [style]
 
     return []
@@ -7,7 +7,7 @@ from pyview.live_routes import LiveViewLookup
 from pyview.csrf import validate_csrf_token
 from pyview.session import deserialize_session
 from pyview.auth import AuthProviderFactory
-from pyview.phx_message import parse_message
+from pyview.phx_message import parse_message, serialize_message
 from pyview.template.render_diff import calc_diff
 
 
@@ -63,7 +63,9 @@ class LiveSocketHandler:
                     {"response": {"rendered": rendered}, "status": "ok"},
                 ]
 
-                await self.manager.send_personal_message(json.dumps(resp), websocket)
+                await self.manager.send_personal_message(
+                    serialize_message(resp), websocket
+                )
                 await self.handle_connected(topic, socket, rendered)
 
         except WebSocketDisconnect:
@@ -90,7 +92,7 @@ class LiveSocketHandler:
                     {"response": {}, "status": "ok"},
                 ]
                 await self.manager.send_personal_message(
-                    json.dumps(resp), socket.websocket
+                    serialize_message(resp), socket.websocket
                 )
                 continue
 
@@ -104,24 +106,22 @@ class LiveSocketHandler:
                 await socket.liveview.handle_event(payload["event"], value, socket)
                 rendered = await _render(socket)
 
-                hook_events = (
-                    {} if not socket.pending_events else {"e": socket.pending_events}
-                )
-
                 diff = calc_diff(prev_rendered, rendered)
                 prev_rendered = rendered
 
-                socket.pending_events = []
+                if socket.pending_events:
+                    diff["e"] = socket.pending_events
+                    socket.pending_events = []
 
                 resp = [
                     joinRef,
                     mesageRef,
                     topic,
                     "phx_reply",
-                    {"response": {"diff": diff | hook_events}, "status": "ok"},
+                    {"response": {"diff": diff}, "status": "ok"},
                 ]
                 await self.manager.send_personal_message(
-                    json.dumps(resp), socket.websocket
+                    serialize_message(resp), socket.websocket
                 )
                 continue
 
@@ -142,7 +142,7 @@ class LiveSocketHandler:
                     {"response": {"diff": diff}, "status": "ok"},
                 ]
                 await self.manager.send_personal_message(
-                    json.dumps(resp), socket.websocket
+                    serialize_message(resp), socket.websocket
                 )
                 continue
 
@@ -167,7 +167,7 @@ class LiveSocketHandler:
                 ]
 
                 await self.manager.send_personal_message(
-                    json.dumps(resp), socket.websocket
+                    serialize_message(resp), socket.websocket
                 )
                 continue
 
@@ -184,7 +184,7 @@ class LiveSocketHandler:
                 ]
 
                 await self.manager.send_personal_message(
-                    json.dumps(resp), socket.websocket
+                    serialize_message(resp), socket.websocket
                 )
 
             if event == "chunk":
@@ -200,7 +200,7 @@ class LiveSocketHandler:
 
                 if socket.upload_manager.no_progress(joinRef):
                     await self.manager.send_personal_message(
-                        json.dumps(
+                        serialize_message(
                             [
                                 joinRef,
                                 None,
@@ -213,7 +213,7 @@ class LiveSocketHandler:
                     )
 
                 await self.manager.send_personal_message(
-                    json.dumps(resp), socket.websocket
+                    serialize_message(resp), socket.websocket
                 )
 
             if event == "progress":
@@ -231,7 +231,7 @@ class LiveSocketHandler:
                 ]
 
                 await self.manager.send_personal_message(
-                    json.dumps(resp), socket.websocket
+                    serialize_message(resp), socket.websocket
                 )
 
 
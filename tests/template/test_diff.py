@@ -110,3 +110,10 @@ def test_statics_only_change():
     r2 = t2.tree({"greeting": "Hello"})
 
     assert calc_diff(r1, r2) == {"s": ["<div>", "</div>"]}
+
+
+def test_diff_same_tree():
+    t = Template("<div>{% for i in items %}<span>{{i}}</span>{% endfor %}</div>")
+    tree = t.tree({"items": [1, 2]})
+
+    assert calc_diff(tree, tree) == {}
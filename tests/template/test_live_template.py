@@ -0,0 +1,65 @@
+from dataclasses import dataclass
+from pyview.vendor.ibis import Template
+import importlib
+from pyview.template import (
+    LiveTemplate,
+    template_file,
+    warm_templates,
+    find_associated_file,
+)
+from pyview.meta import PyViewMeta
+from pyview.template.live_template import _cache
+
+
+@dataclass
+class Item:
+    name: str
+
+
+@dataclass
+class Context:
+    items: list[Item]
+
+    @property
+    def count(self) -> int:
+        return len(self.items)
+
+
+def test_render_dataclass_includes_properties():
+    t = LiveTemplate(
+        Template(
+            "<p>{{count}}</p>{% for item in items %}<b>{{item.name}}</b>{% endfor %}"
+        )
+    )
+    context = Context(items=[Item("a"), Item("b")])
+
+    assert t.render(context, PyViewMeta()) == "<p>2</p><b>a</b><b>b</b>"
+
+
+def test_warm_templates(tmp_path):
+    (tmp_path / "views").mkdir()
+    (tmp_path / "views" / "count.html").write_text("<p>{{count}}</p>")
+    (tmp_path / "index.html").write_text("<p>index</p>")
+    (tmp_path / "style.css").write_text("p {}")
+
+    assert warm_templates(str(tmp_path)) == 2
+    assert template_file(str(tmp_path / "views" / "count.html")) is not None
+
+
+def test_warm_templates_hit_from_view_lookup(tmp_path, monkeypatch):
+    views = tmp_path / "views"
+    views.mkdir()
+    (views / "warmed_view.py").write_text("class WarmedView:\n    pass\n")
+    (views / "warmed_view.html").write_text("<p>warm</p>")
+    (views / "loop").symlink_to(views)
+
+    monkeypatch.syspath_prepend(str(views))
+    module = importlib.import_module("warmed_view")
+    monkeypatch.chdir(tmp_path)
+
+    assert warm_templates("views") == 1
+
+    html = find_associated_file(module.WarmedView(), ".html")
+    assert html is not None
+    assert html in _cache
+    assert template_file(html) is _cache[html][1]
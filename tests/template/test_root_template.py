@@ -0,0 +1,53 @@
+from markupsafe import Markup
+from pyview.template.root_template import RootTemplateContext, defaultRootTemplate
+
+
+def _wrap(context: RootTemplateContext, content: Markup) -> Markup:
+    return Markup("<main>") + content + Markup("</main>")
+
+
+def test_default_root_template_renders_full_page():
+    template = defaultRootTemplate(
+        css=Markup('<link rel="stylesheet" href="/app.css">'),
+        content_wrapper=_wrap,
+    )
+    context: RootTemplateContext = {
+        "id": "abc123",
+        "content": "<p>Hello</p>",
+        "title": "Counter",
+        "csrf_token": "token",
+        "session": "session-data",
+        "additional_head_elements": [
+            Markup("<style>p { color: red; }</style>"),
+            Markup('<meta name="description" content="counter">'),
+        ],
+    }
+
+    expected = """
+<!DOCTYPE html>
+<html lang="en">
+    <head>
+      <title data-suffix=" | LiveView">Counter | LiveView</title>
+      <meta name="csrf-token" content="token" />
+      <meta charset="utf-8">
+      <meta http-equiv="X-UA-Compatible" content="IE=edge">
+      <meta name="viewport" content="width=device-width, initial-scale=1, shrink-to-fit=no">
+      <link rel="stylesheet" href="/app.css">
+      <script defer type="text/javascript" src="/static/assets/app.js"></script>
+      <style>p { color: red; }</style>
+<meta name="description" content="counter">
+    </head>
+    <body><main>
+      <div
+        data-phx-main="true"
+        data-phx-session="session-data"
+        data-phx-static=""
+        id="phx-abc123"
+        >
+        <p>Hello</p>
+    </div></main>
+    </body>
+</html>
+"""
+
+    assert template(context) == expected.encode("utf-8")
@@ -0,0 +1,44 @@
+import importlib
+import os
+from pyview.template import find_associated_css, find_associated_file
+import pyview.template.utils as template_utils
+
+
+def _load_view(tmp_path, monkeypatch, name: str):
+    (tmp_path / f"{name}.py").write_text("class View:\n    pass\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    return importlib.import_module(name).View()
+
+
+def test_css_reloads_when_file_changes(tmp_path, monkeypatch):
+    view = _load_view(tmp_path, monkeypatch, "css_reload_view")
+    css = tmp_path / "css_reload_view.css"
+
+    css.write_text("p { color: red; }")
+    os.utime(css, ns=(1_000_000_000, 1_000_000_000))
+    assert find_associated_css(view) == ["<style>p { color: red; }</style>"]
+
+    css.write_text("p { color: blue; }")
+    os.utime(css, ns=(2_000_000_000, 2_000_000_000))
+    assert find_associated_css(view) == ["<style>p { color: blue; }</style>"]
+
+
+def test_missing_associated_file_is_cached(tmp_path, monkeypatch):
+    view = _load_view(tmp_path, monkeypatch, "missing_file_view")
+
+    assert find_associated_file(view, ".css") is None
+
+    # within the recheck window the miss is served from the cache
+    (tmp_path / "missing_file_view.css").write_text("p {}")
+    assert find_associated_file(view, ".css") is None
+
+
+def test_associated_file_added_later_is_found(tmp_path, monkeypatch):
+    monkeypatch.setattr(template_utils, "_MISS_RECHECK_SECONDS", 0)
+    view = _load_view(tmp_path, monkeypatch, "added_later_view")
+
+    assert find_associated_file(view, ".html") is None
+
+    html = tmp_path / "added_later_view.html"
+    html.write_text("<p>hi</p>")
+    assert find_associated_file(view, ".html") == str(html)
@@ -0,0 +1,29 @@
+import pytest
+from pyview.live_routes import LiveViewLookup
+from pyview.live_view import LiveView
+
+
+class CountLiveView(LiveView):
+    pass
+
+
+def test_lookup_exact_path():
+    lookup = LiveViewLookup()
+    lookup.add("/count", CountLiveView)
+
+    assert isinstance(lookup.get("/count"), CountLiveView)
+
+
+def test_lookup_trailing_slash():
+    lookup = LiveViewLookup()
+    lookup.add("/count", CountLiveView)
+
+    assert isinstance(lookup.get("/count/"), CountLiveView)
+
+
+def test_lookup_missing_path():
+    lookup = LiveViewLookup()
+    lookup.add("/count", CountLiveView)
+
+    with pytest.raises(ValueError):
+        lookup.get("/missing/")
@@ -0,0 +1,151 @@
+import asyncio
+import json
+from typing import Any
+from pyview.live_socket import ConnectedLiveViewSocket
+
+
+class FakeWebSocket:
+    def __init__(self):
+        self.sent: list[str] = []
+
+    async def send_text(self, text: str):
+        self.sent.append(text)
+
+
+class FakeRender:
+    def tree(self) -> dict[str, Any]:
+        return {"s": ["<p>", "</p>"], "0": "hi"}
+
+
+class FakeLiveView:
+    def __init__(self, fail: bool = False):
+        self.infos: list[Any] = []
+        self.fail = fail
+
+    async def handle_info(self, event, socket):
+        if self.fail:
+            raise ValueError("boom")
+        self.infos.append(event)
+
+    async def handle_params(self, url, params, socket):
+        pass
+
+    async def render(self, assigns, meta):
+        return FakeRender()
+
+    async def disconnect(self, socket):
+        pass
+
+
+def _socket(liveview: FakeLiveView) -> tuple[ConnectedLiveViewSocket, FakeWebSocket]:
+    ws = FakeWebSocket()
+    socket = ConnectedLiveViewSocket(ws, "lv:phx-test", liveview)  # type: ignore
+    socket.context = {}
+    return socket, ws
+
+
+def test_schedule_info_once_logs_failures(caplog):
+    async def run():
+        socket, _ = _socket(FakeLiveView(fail=True))
+        socket.schedule_info_once("ping")
+        for _ in range(5):
+            await asyncio.sleep(0)
+        return socket
+
+    socket = asyncio.run(run())
+    assert not socket._info_tasks
+    [record] = [r for r in caplog.records if r.levelname == "ERROR"]
+    assert record.exc_info[0] is ValueError
+
+
+def test_queued_infos_coalesce_per_key():
+    async def run():
+        liveview = FakeLiveView()
+        socket, ws = _socket(liveview)
+        await socket._queue_info("lv:phx-test:ping", "ping-1")
+        await socket._queue_info("lv:phx-test:ping", "ping-2")
+        await socket._queue_info("lv:phx-test:ping", "ping-3")
+        for _ in range(5):
+            await asyncio.sleep(0)
+        await socket.close()
+        return liveview, ws
+
+    liveview, ws = asyncio.run(run())
+    assert liveview.infos == ["ping-3"]
+    assert len(ws.sent) == 1
+
+
+def test_close_stops_send_worker():
+    async def run():
+        socket, _ = _socket(FakeLiveView())
+        await socket._queue_info("lv:phx-test:ping", "ping")
+        worker = socket._send_worker
+        assert worker is not None
+
+        await socket.close()
+        await asyncio.sleep(0)
+        return socket, worker
+
+    socket, worker = asyncio.run(run())
+    assert worker.done()
+    assert socket._send_worker is None
+    assert not socket._pending_sends
+
+
+def test_queue_info_after_close_is_dropped():
+    async def run():
+        liveview = FakeLiveView()
+        socket, ws = _socket(liveview)
+        await socket.close()
+        await socket._queue_info("lv:phx-test:ping", "ping")
+        await asyncio.sleep(0)
+        return socket, liveview, ws
+
+    socket, liveview, ws = asyncio.run(run())
+    assert socket._send_worker is None
+    assert not socket._pending_sends
+    assert not liveview.infos
+    assert not ws.sent
+
+
+def test_send_worker_exits_once_disconnected():
+    async def run():
+        socket, _ = _socket(FakeLiveView())
+        await socket._queue_info("lv:phx-test:ping", "ping")
+        worker = socket._send_worker
+        assert worker is not None
+        for _ in range(5):
+            await asyncio.sleep(0)
+
+        socket.connected = False
+        socket._send_event.set()
+        for _ in range(5):
+            await asyncio.sleep(0)
+        return worker
+
+    worker = asyncio.run(run())
+    assert worker.done() and not worker.cancelled()
+
+
+def test_pushed_frames_are_valid_json():
+    topic = 'lv:phx-"q\\'
+
+    async def run():
+        liveview = FakeLiveView()
+        ws = FakeWebSocket()
+        socket = ConnectedLiveViewSocket(ws, topic, liveview)  # type: ignore
+        socket.context = {}
+        await socket.push_patch('/a"b', {"q": "x&y"})
+        await socket.send_info("ping")  # type: ignore
+        return ws
+
+    ws = asyncio.run(run())
+    patch, diff = [json.loads(frame) for frame in ws.sent]
+    assert patch == [
+        None,
+        None,
+        topic,
+        "live_patch",
+        {"kind": "push", "to": '/a"b?q=x%26y'},
+    ]
+    assert diff == [None, None, topic, "diff", {"0": "hi"}]